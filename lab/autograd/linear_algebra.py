@@ -81,6 +81,16 @@ def solve(a: Numeric, b: Numeric):
     return anp.linalg.solve(a, b)
 
 
+@dispatch
+def lu_factor(a: Numeric):  # pragma: no cover
+    raise NotImplementedError("Function `lu_factor` is not available for AutoGrad.")
+
+
+@dispatch
+def lu_solve(lu: Numeric, piv: Numeric, b: Numeric):  # pragma: no cover
+    raise NotImplementedError("Function `lu_solve` is not available for AutoGrad.")
+
+
 @dispatch
 def inv(a: Numeric):
     return anp.linalg.inv(a)
@@ -202,12 +202,26 @@ def s_bvn_cdf(s_y, y, a, b, c):
     return tuple(x.astype(res_dtype) for x in res)
 
 
+def _writeable(a):
+    """Get `a` as a writeable array. SciPy sometimes fails with the error that the
+    buffer source array is read-only, so read-only arrays are copied. See also
+    `toeplitz_solve`.
+
+    Args:
+        a (tensor): Tensor to get as a writeable array.
+
+    Returns:
+        tensor: `a` as a writeable array.
+    """
+    a = np.asarray(a)
+    if a.flags.writeable:
+        return a
+    else:
+        return np.copy(a)
+
+
 def expm(a):
-    # This sometimes fails that the buffer source array is read-only. We resolve this
-    # issue by copying the inputs. See also `toeplitz_solve`.
-    # TODO: Resolve this properly.
-    a = np.copy(a)
-    return sla.expm(a)
+    return sla.expm(_writeable(a))
 
 
 def i_expm(a):
@@ -223,11 +237,7 @@ def i_s_expm(s_y, y, a):
 
 
 def logm(a):
-    # This sometimes fails that the buffer source array is read-only. We resolve this
-    # issue by copying the inputs. See also `toeplitz_solve`.
-    # TODO: Resolve this properly.
-    a = np.copy(a)
-    return sla.logm(a)
+    return sla.logm(_writeable(a))
 
 
 def i_logm(a):
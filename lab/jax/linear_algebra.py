@@ -77,6 +77,16 @@ def solve(a: Numeric, b: Numeric):
     return jnp.linalg.solve(a, b)
 
 
+@dispatch
+def lu_factor(a: Numeric):
+    return jsla.lu_factor(a)
+
+
+@dispatch
+def lu_solve(lu: Numeric, piv: Numeric, b: Numeric):
+    return jsla.lu_solve((lu, piv), b)
+
+
 @dispatch
 def inv(a: Numeric):
     return jnp.linalg.inv(a)
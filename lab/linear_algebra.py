@@ -20,6 +20,8 @@ __all__ = [
     "svd",
     "eig",
     "solve",
+    "lu_factor",
+    "lu_solve",
     "inv",
     "pinv",
     "det",
@@ -31,6 +33,7 @@ __all__ = [
     "chol",
     "cholesky_solve",
     "cholsolve",
+    "logdet_from_chol",
     "triangular_solve",
     "trisolve",
     "toeplitz_solve",
@@ -233,10 +236,42 @@ def solve(a, b):  # pragma: no cover
     """
 
 
+@dispatch
+@abstract()
+def lu_factor(a: Numeric):  # pragma: no cover
+    """Compute the LU factorisation of `a` with partial pivoting. The factorisation
+    can be reused with `lu_solve` to solve for many right-hand sides without
+    factorising `a` again.
+
+    Args:
+        a (tensor): Matrix to factorise.
+
+    Returns:
+        tuple: `(lu, piv)` where `lu` contains the factors and `piv` the pivots. The
+            format of the pivots depends on the backend.
+    """
+
+
+@dispatch
+@abstract(promote=3)
+def lu_solve(lu, piv, b):  # pragma: no cover
+    """Solve the linear system `a x = b` given the LU factorisation of `a`.
+
+    Args:
+        lu (tensor): Factors of `a` as computed by `lu_factor`.
+        piv (tensor): Pivots of `a` as computed by `lu_factor`.
+        b (tensor): RHS `b`.
+
+    Returns:
+        tensor: Solution `x`.
+    """
+
+
 @dispatch
 @abstract()
 def inv(a):  # pragma: no cover
-    """Compute the inverse of `a`.
+    """Compute the inverse of `a`. To compute `inv(a) @ b`, use `solve(a, b)`
+    instead, which is cheaper and numerically more stable.
 
     Args:
         a (tensor): Matrix to compute inverse of.
@@ -380,6 +415,21 @@ def cholesky_solve(a, b):  # pragma: no cover
 cholsolve = cholesky_solve  #: Shorthand for `cholesky_solve`.
 
 
+@dispatch
+def logdet_from_chol(a):
+    """Compute the log-determinant of a matrix given its Cholesky factorisation. This
+    only requires the diagonal of the factorisation, so it is much cheaper than
+    `logdet`.
+
+    Args:
+        a (tensor): Cholesky factorisation of the matrix.
+
+    Returns:
+        scalar: Log-determinant of the matrix.
+    """
+    return 2 * B.sum(B.log(B.diag_extract(a)), axis=-1)
+
+
 @dispatch
 @abstract(promote=2)
 def triangular_solve(a, b, lower_a: bool = True):  # pragma: no cover
@@ -1,4 +1,6 @@
 import logging
+import os
+from functools import lru_cache
 from typing import Optional, Union
 
 import numpy as np
@@ -10,36 +12,152 @@ from ..custom import logm as _logm
 from ..custom import toeplitz_solve as _toeplitz_solve
 from ..linear_algebra import _default_perm
 from ..types import Int
-from ..util import batch_computation
 from . import B, Numeric, dispatch
 
 __all__ = []
 
 log = logging.getLogger(__name__)
 
+_einsum_backend = os.environ.get("LAB_EINSUM_BACKEND", "auto")
+"""str: Backend for contractions of three or more tensors. Set to `"numpy"` to use
+`np.einsum` with `optimize=True`, `"opt_einsum"` to use a cached `opt_einsum`
+expression, or `"auto"` to use `np.einsum` for small contractions only."""
+
+_einsum_auto_size = 1_000_000
+"""int: For `"auto"`, the total number of elements below which `np.einsum` is used."""
+
+
+def _swap_last(a):
+    # For tensors of rank two or higher, `np.swapaxes` is a view and avoids the
+    # dispatch and the special cases of `transpose`.
+    return np.swapaxes(a, -1, -2) if np.ndim(a) >= 2 else transpose(a)
+
 
 @dispatch
 def matmul(a: Numeric, b: Numeric, tr_a: bool = False, tr_b: bool = False):
-    a = transpose(a) if tr_a else a
-    b = transpose(b) if tr_b else b
+    if tr_a and tr_b and np.ndim(a) >= 2 and np.ndim(b) >= 2:
+        # Use that `a^T b^T = (b a)^T` to save a transposition.
+        return np.swapaxes(np.matmul(b, a), -1, -2)
+    a = _swap_last(a) if tr_a else a
+    b = _swap_last(b) if tr_b else b
     return np.matmul(a, b)
 
 
+@lru_cache(maxsize=1024)
+def _contract_expression(equation, *shapes):
+    """Construct a contraction expression for `einsum`. Finding a contraction path
+    can be expensive, so the expression is cached by equation and shapes.
+
+    Args:
+        equation (str): Equation.
+        *shapes (tuple[int]): Shapes of the tensors to contract.
+
+    Returns:
+        :class:`opt_einsum.contract.ContractExpression`: Contraction expression.
+    """
+    return oe.contract_expression(equation, *shapes, optimize="auto")
+
+
+@lru_cache(maxsize=1024)
+def _tensordot_plan(equation):
+    """Attempt to express a two-operand equation as a call to `np.tensordot`.
+
+    Args:
+        equation (str): Equation.
+
+    Returns:
+        tuple or None: If the equation is a tensor dot product, a tuple containing the
+            positions of the contracted indices in both operands and the permutation
+            to apply to the result of `np.tensordot`. The permutation is `None` if no
+            permutation is necessary. If the equation is not a tensor dot product,
+            `None` is returned.
+    """
+    if "." in equation:
+        return None
+    equation = equation.replace(" ", "")
+    if "->" in equation:
+        inputs, output = equation.split("->")
+    else:
+        # In implicit mode, the output consists of the indices which appear exactly
+        # once, in alphabetical order.
+        inputs = equation
+        output = "".join(sorted(i for i in set(inputs) - {","} if inputs.count(i) == 1))
+    inputs = inputs.split(",")
+    if len(inputs) != 2:
+        return None
+    lhs_a, lhs_b = inputs
+
+    # Repeated indices within an operand are traces or diagonals, which
+    # `np.tensordot` cannot do.
+    if any(len(set(x)) != len(x) for x in (lhs_a, lhs_b, output)):
+        return None
+
+    summed = (set(lhs_a) & set(lhs_b)) - set(output)
+    free = [i for i in lhs_a + lhs_b if i not in summed]
+    # This also excludes batch indices and indices summed in only one operand.
+    if sorted(free) != sorted(output):
+        return None
+
+    pairs = [(lhs_a.index(i), lhs_b.index(i)) for i in lhs_a if i in summed]
+    perm = tuple(free.index(i) for i in output)
+    if perm == tuple(range(len(perm))):
+        perm = None
+    return pairs, perm
+
+
 @dispatch
 def einsum(equation: str, *elements: Numeric):
-    return oe.contract(equation, *elements, backend="numpy")
+    # Path optimisation does not pay off for one or two operands.
+    if len(elements) == 2:
+        plan = _tensordot_plan(equation)
+        if plan is not None:
+            a, b = elements
+            pairs, perm = plan
+            # `np.tensordot` copies an operand unless its contracted axes are in
+            # memory order and come after (first operand) or before (second
+            # operand) its free axes. Order the contracted axes by the strides of
+            # the larger operand. This avoids copying the larger operand when its
+            # free axes are already in the right place, but does not move them.
+            if np.size(a) >= np.size(b):
+                strides = np.asarray(a).strides
+                pairs = sorted(pairs, key=lambda p: -strides[p[0]])
+            else:
+                strides = np.asarray(b).strides
+                pairs = sorted(pairs, key=lambda p: -strides[p[1]])
+            axes = tuple(zip(*pairs)) if pairs else ((), ())
+            res = np.tensordot(a, b, axes=axes)
+            return res if perm is None else np.transpose(res, perm)
+    if len(elements) <= 2:
+        return np.einsum(equation, *elements)
+
+    if _einsum_backend == "auto":
+        use_numpy = sum(np.size(e) for e in elements) < _einsum_auto_size
+    elif _einsum_backend in {"numpy", "opt_einsum"}:
+        use_numpy = _einsum_backend == "numpy"
+    else:
+        raise ValueError(
+            f'Unknown einsum backend "{_einsum_backend}". '
+            f'Must be "auto", "numpy", or "opt_einsum".'
+        )
+    if use_numpy:
+        return np.einsum(equation, *elements, optimize=True)
+
+    expr = _contract_expression(equation, *(np.shape(e) for e in elements))
+    return expr(*elements, backend="numpy")
 
 
 @dispatch
 def transpose(a: Numeric, perm: Optional[Union[tuple, list]] = None):
-    # Correctly handle special cases.
-    rank_a = B.rank(a)
+    # Correctly handle special cases. Handle the common case of a matrix without
+    # computing the default permutation.
+    rank_a = np.ndim(a)
     if rank_a == 0:
         return a
-    elif rank_a == 1 and perm is None:
-        return a[None, :]
-
-    if perm is None:
+    elif perm is None:
+        if rank_a == 1:
+            return a[None, :]
+        elif rank_a == 2:
+            return a.T
         perm = _default_perm(a)
     return np.transpose(a, axes=perm)
 
@@ -52,7 +170,13 @@ def trace(a: Numeric, axis1: Int = -2, axis2: Int = -1):
 @dispatch
 def svd(a: Numeric, compute_uv: bool = True):
     res = np.linalg.svd(a, full_matrices=False, compute_uv=compute_uv)
-    return (res[0], res[1], np.conj(transpose(res[2]))) if compute_uv else res
+    if not compute_uv:
+        return res
+    u, s, vh = res
+    # Conjugation allocates, so skip it for real inputs. The transposition is a view.
+    if np.iscomplexobj(vh):
+        vh = vh.conj()
+    return u, s, np.swapaxes(vh, -1, -2)
 
 
 @dispatch
@@ -66,6 +190,31 @@ def solve(a: Numeric, b: Numeric):
     return np.linalg.solve(a, b)
 
 
+@dispatch
+def lu_factor(a: Numeric):
+    if a.ndim == 2:
+        return sla.lu_factor(a, check_finite=False)
+    if 0 in a.shape[:-2]:
+        # The batch is empty, so there is nothing to factorise.
+        dtype = np.result_type(a, np.float32)
+        return np.zeros(a.shape, dtype=dtype), np.zeros(a.shape[:-1], dtype=np.int32)
+    lus, pivs = zip(
+        *(sla.lu_factor(a[i], check_finite=False) for i in np.ndindex(*a.shape[:-2]))
+    )
+    # Store every factor in Fortran order, so `lu_solve` can pass the factors to
+    # LAPACK without copying them.
+    lus = np.reshape(np.stack([lu.T for lu in lus]), a.shape[:-2] + a.shape[-2:][::-1])
+    return np.swapaxes(lus, -1, -2), np.reshape(np.stack(pivs), a.shape[:-1])
+
+
+@dispatch
+def lu_solve(lu: Numeric, piv: Numeric, b: Numeric):
+    def _lu_solve(lu_, b_, piv_):
+        return sla.lu_solve((lu_, piv_), b_, check_finite=False)
+
+    return _batch_solve(_lu_solve, lu, b, piv)
+
+
 @dispatch
 def inv(a: Numeric):
     return np.linalg.inv(a)
@@ -98,17 +247,177 @@ def _cholesky(a: Numeric):
 
 @dispatch
 def cholesky_solve(a: Numeric, b: Numeric):
-    return triangular_solve(transpose(a), triangular_solve(a, b), lower_a=False)
+    if np.iscomplexobj(a):
+        # `potrs` solves against the conjugate transpose of `a`, so perform
+        # both triangular solves separately. Let LAPACK solve against the
+        # transpose rather than transposing `a` here.
+        return _triangular_solve(a, _triangular_solve(a, b), trans="T")
 
+    # Unlike `trtrs`, `potrs` does not check for singularity, so check here.
+    _check_triangular_singular(a)
 
-@dispatch
-def triangular_solve(a: Numeric, b: Numeric, lower_a: bool = True):
-    def _triangular_solve(a_, b_):
-        return sla.solve_triangular(
-            a_, b_, trans="N", lower=lower_a, check_finite=False
+    # Look up the LAPACK routine once rather than for every batch.
+    (potrs,) = sla.lapack.get_lapack_funcs(("potrs",), (a, b))
+
+    def _cholesky_solve(a_, b_):
+        # This performs both triangular solves in a single call to LAPACK. If `a_`
+        # is C-contiguous, pass its transpose, which is Fortran-contiguous and so is
+        # not copied by LAPACK. For real `a_`, `a_ a_^T = (a_^T)^T a_^T`.
+        if _c_ordered(a_):
+            x, info = potrs(a_.T, b_, lower=False)
+        else:
+            x, info = potrs(a_, b_, lower=True)
+        _check_lapack_info("potrs", info)
+        return x
+
+    return _batch_solve(_cholesky_solve, a, b)
+
+
+def _c_ordered(a):
+    """Check whether a matrix is C-contiguous, but not Fortran-contiguous.
+
+    Args:
+        a (tensor): Matrix.
+
+    Returns:
+        bool: `True` if `a` is C-contiguous, but not Fortran-contiguous.
+    """
+    return a.flags.c_contiguous and not a.flags.f_contiguous
+
+
+def _check_triangular_singular(a):
+    """Check whether a triangular matrix or a batch of triangular matrices is exactly
+    singular.
+
+    Args:
+        a (tensor): Triangular matrix or batch of triangular matrices.
+    """
+    if np.any(np.diagonal(a, axis1=-2, axis2=-1) == 0):
+        raise np.linalg.LinAlgError("Singular matrix.")
+
+
+def _check_lapack_info(routine, info):
+    """Check the status returned by a LAPACK solver.
+
+    Args:
+        routine (str): Name of the LAPACK routine.
+        info (int): Status returned by the routine.
+    """
+    if info > 0:
+        raise np.linalg.LinAlgError(
+            f"Singular matrix: resolution failed at diagonal {info - 1}."
         )
+    elif info < 0:
+        raise ValueError(f"Illegal value in argument {-info} of `{routine}`.")
+
+
+def _batch_solve(f, a, b, piv=None):
+    """Apply a solver over all batches of a matrix and a right-hand side.
+
+    Args:
+        f (function): Solver which takes in a matrix and a right-hand side, and the
+            pivots if `piv` is given. The solver must act on the columns of the
+            right-hand side independently.
+        a (tensor): Matrix or batch of matrices.
+        b (tensor): Right-hand side or batch of right-hand sides.
+        piv (tensor, optional): Pivots or batch of pivots which accompany `a`.
+
+    Returns:
+        tensor: Result in batched form.
+    """
+
+    def solve(a_, b_, piv_):
+        return f(a_, b_) if piv_ is None else f(a_, b_, piv_)
+
+    batch_shape = np.broadcast_shapes(a.shape[:-2], b.shape[:-2])
+    if batch_shape == ():
+        return solve(a, b, piv)
+
+    if 0 in batch_shape:
+        # The batch is empty, so there is nothing to solve.
+        dtype = np.result_type(a, b, np.float32)
+        return np.zeros(batch_shape + b.shape[-2:], dtype=dtype)
+
+    # If all batches share the same matrix, concatenate the right-hand sides along
+    # the columns and solve all batches at once.
+    if np.prod(a.shape[:-2]) == 1 and b.ndim > 2:
+        a = np.reshape(a, a.shape[-2:])
+        if piv is not None:
+            piv = np.reshape(piv, piv.shape[-1:])
+        b_cols = np.moveaxis(b, -2, 0)
+        res = solve(a, np.reshape(b_cols, (b_cols.shape[0], -1)), piv)
+        res = np.moveaxis(np.reshape(res, b_cols.shape), 0, -2)
+        return np.reshape(res, batch_shape + res.shape[-2:])
+
+    # LAPACK copies every matrix that is not Fortran-contiguous. The triangular and
+    # Cholesky solvers handle C-contiguous matrices by solving against the
+    # transpose. Otherwise, copy all matrices at once before broadcasting, so
+    # broadcast matrices are copied only once.
+    if not (a.flags.c_contiguous or np.swapaxes(a, -1, -2).flags.c_contiguous):
+        a = np.swapaxes(np.ascontiguousarray(np.swapaxes(a, -1, -2)), -1, -2)
+
+    # Broadcasting produces views, so this does not copy any data.
+    a = np.broadcast_to(a, batch_shape + a.shape[-2:])
+    b = np.broadcast_to(b, batch_shape + b.shape[-2:])
+    if piv is not None:
+        piv = np.broadcast_to(piv, batch_shape + piv.shape[-1:])
+    res = [
+        solve(a[i], b[i], None if piv is None else piv[i])
+        for i in np.ndindex(*batch_shape)
+    ]
+    res = np.stack(res, axis=0)
+    return np.reshape(res, batch_shape + res.shape[1:])
+
+
+_triangular_solve_small = 16
+"""int: Size up to which batches of triangular matrices are solved with a single call
+to `np.linalg.solve` rather than one call to LAPACK per batch. `np.linalg.solve` uses
+an LU decomposition with partial pivoting instead of substitution, so, for
+ill-conditioned matrices, results can differ slightly from those for unbatched
+matrices, which are always solved by substitution. Set to zero to always solve by
+substitution."""
+
+
+def _triangular_solve(a, b, lower_a=True, trans="N"):
+    if (
+        np.prod(a.shape[:-2]) > 1
+        and b.ndim >= 2
+        and a.shape[-1] <= _triangular_solve_small
+    ):
+        # For small matrices, calling LAPACK for every batch is dominated by the
+        # overhead of the call. `np.linalg.solve` loops over the batches in C, which
+        # outweighs not exploiting the triangular structure. This is not exactly
+        # equivalent to substitution: see `_triangular_solve_small`.
+        # Match LAPACK, which checks for exact singularity.
+        _check_triangular_singular(a)
+        a = np.tril(a) if lower_a else np.triu(a)
+        if trans == "T":
+            a = np.swapaxes(a, -1, -2)
+        batch_shape = np.broadcast_shapes(a.shape[:-2], b.shape[:-2])
+        a = np.broadcast_to(a, batch_shape + a.shape[-2:])
+        b = np.broadcast_to(b, batch_shape + b.shape[-2:])
+        return np.linalg.solve(a, b)
+
+    # Look up the LAPACK routine once rather than for every batch.
+    (trtrs,) = sla.lapack.get_lapack_funcs(("trtrs",), (a, b))
+    trans = {"N": 0, "T": 1}[trans]
+
+    def _solve(a_, b_):
+        if _c_ordered(a_):
+            # The transpose is Fortran-contiguous, so LAPACK can use it without
+            # copying. Pass the transpose and flip `lower` and `trans` accordingly.
+            x, info = trtrs(a_.T, b_, lower=not lower_a, trans=1 - trans)
+        else:
+            x, info = trtrs(a_, b_, lower=lower_a, trans=trans)
+        _check_lapack_info("trtrs", info)
+        return x
+
+    return _batch_solve(_solve, a, b)
+
 
-    return batch_computation(_triangular_solve, (a, b), (2, 2))
+@dispatch
+def triangular_solve(a: Numeric, b: Numeric, lower_a: bool = True):
+    return _triangular_solve(a, b, lower_a=lower_a)
 
 
 @dispatch
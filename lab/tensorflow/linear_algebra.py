@@ -64,6 +64,16 @@ def solve(a: Numeric, b: Numeric):
     return tf.linalg.solve(a, b)
 
 
+@dispatch
+def lu_factor(a: Numeric):
+    return tf.linalg.lu(a)
+
+
+@dispatch
+def lu_solve(lu: Numeric, piv: Numeric, b: Numeric):
+    return tf.linalg.lu_solve(lu, piv, b)
+
+
 @dispatch
 def inv(a: Numeric):
     return tf.linalg.inv(a)
@@ -60,6 +60,16 @@ def solve(a: Numeric, b: Numeric):
     return torch.linalg.solve(a, b)
 
 
+@dispatch
+def lu_factor(a: Numeric):
+    return torch.linalg.lu_factor(a)
+
+
+@dispatch
+def lu_solve(lu: Numeric, piv: Numeric, b: Numeric):
+    return torch.linalg.lu_solve(lu, piv, b)
+
+
 @dispatch
 def inv(a: Numeric):
     return torch.inverse(a)
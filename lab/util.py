@@ -1,4 +1,5 @@
-from functools import wraps
+from functools import lru_cache, wraps
+from itertools import product
 
 import numpy as np
 import plum
@@ -35,26 +36,27 @@ def resolve_axis(a, axis, negative=False):
     if axis is None:
         return None
 
-    given_axis = axis
-
     # If it isn't a `None` we should resolve it.
-    a_rank = B.rank(a)
+    resolved_axis = _resolve_axis(B.rank(a), axis, negative)
+    if resolved_axis is None:
+        raise ValueError(
+            f"Axis {axis} cannot be resolved for tensor of shape {B.shape(a)}."
+        )
+    return resolved_axis
+
+
+@lru_cache(maxsize=256)
+def _resolve_axis(a_rank, axis, negative):
     if not negative:
         if axis < 0:
             axis = axis + a_rank
         if not (0 <= axis < a_rank):
-            raise ValueError(
-                f"Axis {given_axis} cannot be resolved for tensor of shape "
-                f"{B.shape(a)}."
-            )
+            return None
     else:
         if axis >= 0:
             axis = axis - a_rank
         if not (-a_rank <= axis < 0):
-            raise ValueError(
-                f"Axis {given_axis} cannot be resolved for tensor of shape "
-                f"{B.shape(a)}."
-            )
+            return None
     return axis
 
 
@@ -77,47 +79,13 @@ def as_tuple(x):
 
 
 def _common_shape(*shapes):
-    common_shape = shapes[0]
-    for shape in shapes[1:]:
-        # Add empty dimensions to either shape if it is shorter.
-        diff = len(common_shape) - len(shape)
-        shape = (1,) * max(diff, 0) + shape
-        common_shape = (1,) * max(-diff, 0) + common_shape
-
-        # Resolve the shapes.
-        new_common_shape = ()
-        for d1, d2 in zip(common_shape, shape):
-            if d1 == d2:
-                new_common_shape += (d1,)
-            elif d1 == 1:
-                new_common_shape += (d2,)
-            elif d2 == 1:
-                new_common_shape += (d1,)
-            else:
-                raise RuntimeError(
-                    f"Cannot reconcile running common shape {common_shape} "
-                    f"with {shape}."
-                )
-        common_shape = new_common_shape
-    return common_shape
-
-
-def _translate_index(index, batch_shape):
-    # Remove superfluous index dimensions and cast to tuple.
-    index = tuple(index[-len(batch_shape) :])
-
-    # Resolve the index.
-    translated_index = ()
-    for i, s in zip(index, batch_shape):
-        if i < s:
-            translated_index += (i,)
-        elif s == 1:
-            translated_index += (0,)
-        else:
-            raise RuntimeError(
-                f"Cannot translate index {index} to batch shape {batch_shape}."
-            )
-    return translated_index
+    # Force evaluation of the dimensions: if the shapes are lazy, the dimensions may
+    # still be wrapped.
+    shapes = [tuple(int(d) for d in shape) for shape in shapes]
+    try:
+        return np.broadcast_shapes(*shapes)
+    except ValueError as e:
+        raise RuntimeError(f"Cannot reconcile shapes {shapes}.") from e
 
 
 def batch_computation(f, xs, ranks):
@@ -134,28 +102,32 @@ def batch_computation(f, xs, ranks):
     # Reshape arguments for batched computation.
     batch_shapes = [B.shape(x)[:-rank] for x, rank in zip(xs, ranks)]
 
-    # Find the common shape.
+    # Find the common shape. This also forces evaluation of the elements of the
+    # shape: if the shapes are lazy or when a function is evaluated abstractly, the
+    # dimensions of the shape may still be wrapped.
     batch_shape = _common_shape(*batch_shapes)
-    # Force evaluation of the element of the shape: if the shapes are lazy or when
-    # a function is evaluated abstractly, the dimensions of the shape may still be
-    # wrapped.
-    indices = np.indices(tuple(int(x) for x in batch_shape))
-
-    # Handle the edge case that there is no batching.
-    if len(indices) == 0:
-        indices = [()]
-    else:
-        # Put the index dimension last.
-        perm = tuple(list(range(1, len(batch_shape) + 1))) + (0,)
-        indices = indices.transpose(perm)
-        # Turn into a list of indices.
-        indices = indices.reshape(-1, len(batch_shape))
 
-    # Loop over batches.
+    # For every argument, determine once which axis of the common batch shape indexes
+    # each of its batch dimensions. Dimensions of size one are broadcast and always
+    # indexed with zero, which is represented by `None`. Broadcasting the arguments
+    # instead would copy them for backends without stride-zero views, such as JAX.
+    index_maps = []
+    for s in batch_shapes:
+        offset = len(batch_shape) - len(s)
+        index_maps.append(
+            tuple(None if int(d) == 1 else offset + i for i, d in enumerate(s))
+        )
+
+    # Loop over batches. If there is no batching, `product` yields a single `()`.
     batches = []
-    for index in indices:
+    for index in product(*(range(s) for s in batch_shape)):
         batches.append(
-            f(*[x[_translate_index(index, s)] for x, s in zip(xs, batch_shapes)])
+            f(
+                *[
+                    x[tuple(0 if i is None else index[i] for i in index_map)]
+                    for x, index_map in zip(xs, index_maps)
+                ]
+            )
         )
 
     # Construct result, reshape, and return.
@@ -251,4 +223,9 @@ def broadcast_shapes(*shapes):
         tuple[int]: Broadcasted shape.
     """
     shapes = [tuple(int(d) for d in shape) for shape in shapes]
+    return _broadcast_shapes(*shapes)
+
+
+@lru_cache(maxsize=256)
+def _broadcast_shapes(*shapes):
     return np.broadcast_shapes(*shapes)
@@ -1,3 +1,5 @@
+import sys
+
 import numpy as np
 import pytest
 
@@ -66,11 +68,41 @@ def test_matmul(f, check_lazy_shapes):
 
 
 def test_einsum(check_lazy_shapes):
-    for eq in ["ij,ij->", "ij,jk->ik", "ii,ii->"]:
+    for eq in ["ij,ij->", "ij,jk->ik", "ii,ii->", "ij,jk", "ia,ab"]:
         check_function(B.einsum, (Value(eq), Tensor(3, 3), Tensor(3, 3)))
     for eq in ["...ij,...ij->...", "...ij,...jk->...ik", "...ii,...ii->..."]:
         check_function(B.einsum, (Value(eq), Tensor(4, 3, 3), Tensor(4, 3, 3)))
 
+    # Check contractions over axes in a different order and permuted outputs.
+    check_function(B.einsum, (Value("ijk,kjl->li"), Tensor(2, 3, 4), Tensor(4, 3, 5)))
+    check_function(B.einsum, (Value("kij,kjl->il"), Tensor(4, 2, 3), Tensor(4, 3, 5)))
+    check_function(B.einsum, (Value("ij,kl->lkji"), Tensor(2, 3), Tensor(4, 5)))
+
+
+@pytest.mark.parametrize("backend", ["auto", "numpy", "opt_einsum"])
+def test_einsum_three_operands(backend, monkeypatch, check_lazy_shapes):
+    # `lab.numpy` is an alias of `lab`, so get the NumPy module directly.
+    monkeypatch.setattr(
+        sys.modules["lab.numpy.linear_algebra"], "_einsum_backend", backend
+    )
+    for eq in ["ij,jk,kl->il", "ij,jk,kl"]:
+        check_function(B.einsum, (Value(eq), Tensor(3, 3), Tensor(3, 3), Tensor(3, 3)))
+
+    # Check correctness.
+    a, b, c = Matrix(3, 4).np(), Matrix(4, 5).np(), Matrix(5, 2).np()
+    approx(B.einsum("ij,jk,kl->il", a, b, c), a @ b @ c)
+
+
+def test_einsum_unknown_backend(monkeypatch, check_lazy_shapes):
+    monkeypatch.setattr(
+        sys.modules["lab.numpy.linear_algebra"], "_einsum_backend", "unknown"
+    )
+    a = Matrix(3, 3).np()
+    with pytest.raises(ValueError):
+        B.einsum("ij,jk,kl->il", a, a, a)
+    # Contractions of one or two tensors do not depend on the backend.
+    approx(B.einsum("ij,jk->ik", a, a), a @ a)
+
 
 def test_trace(check_lazy_shapes):
     # Check default call.
@@ -172,6 +204,39 @@ def test_solve(check_lazy_shapes):
     check_function(B.solve, (Matrix(5, 3, 3), Matrix(5, 3, 4)))
 
 
+def test_lu_solve(monkeypatch, check_lazy_shapes):
+    def lu_solve(a, b):
+        return B.lu_solve(*B.lu_factor(a), b)
+
+    # AutoGrad does not support LU factorisations.
+    check_function(lu_solve, (Matrix(3, 3), Matrix(3, 4)), skip=[B.AGNumeric])
+    check_function(lu_solve, (Matrix(5, 3, 3), Matrix(5, 3, 4)), skip=[B.AGNumeric])
+
+    # Check correctness.
+    a = Matrix(5, 3, 3).np()
+    b = Matrix(5, 3, 4).np()
+    approx(B.lu_solve(*B.lu_factor(a), b), np.linalg.solve(a, b))
+    approx(B.lu_solve(*B.lu_factor(a[0]), b), np.linalg.solve(a[0], b))
+
+    # Check that LAPACK is given factors in Fortran order, so it does not copy them.
+    sla = sys.modules["lab.numpy.linear_algebra"].sla
+    sla_lu_solve = sla.lu_solve
+
+    def lu_solve_fortran(lu_and_piv, *args, **kw_args):
+        assert lu_and_piv[0].flags.f_contiguous
+        return sla_lu_solve(lu_and_piv, *args, **kw_args)
+
+    monkeypatch.setattr(sla, "lu_solve", lu_solve_fortran)
+    approx(B.lu_solve(*B.lu_factor(a), b), np.linalg.solve(a, b))
+    monkeypatch.undo()
+
+    # Check that empty batches are handled.
+    lu, piv = B.lu_factor(np.zeros((0, 3, 3)))
+    assert B.shape(lu) == (0, 3, 3)
+    assert B.shape(piv) == (0, 3)
+    assert B.shape(B.lu_solve(lu, piv, np.ones((0, 3, 2)))) == (0, 3, 2)
+
+
 def test_inv(check_lazy_shapes):
     check_function(B.inv, (Matrix(),))
     check_function(B.inv, (Matrix(4, 3, 3),))
@@ -242,6 +307,35 @@ def test_cholesky_retry_factor(check_lazy_shapes):
 def test_cholesky_solve(f, check_lazy_shapes):
     check_function(f, (PSDTriangular(3, 3), Matrix(3, 4)))
     check_function(f, (PSDTriangular(5, 3, 3), Matrix(5, 3, 4)))
+    # Check a matrix shared between batches.
+    check_function(f, (PSDTriangular(3, 3), Matrix(5, 3, 4)))
+    # Check a batch of larger matrices, which are solved one by one.
+    check_function(f, (PSDTriangular(5, 20, 20), Matrix(5, 20, 4)))
+
+    # Check a batch of matrices which is neither C- nor Fortran-contiguous.
+    a = np.zeros((5, 3, 6))
+    a[..., ::2] = PSDTriangular(5, 3, 3).np()
+    a = a[..., ::2]
+    b = Matrix(5, 3, 4).np()
+    approx(B.cholesky_solve(a, b), np.linalg.solve(a @ np.swapaxes(a, -1, -2), b))
+
+
+def test_cholesky_solve_singular(check_lazy_shapes):
+    a = np.tril(np.ones((3, 3))) + 2 * np.eye(3)
+    a[1, 1] = 0
+    with pytest.raises(np.linalg.LinAlgError):
+        B.cholesky_solve(a, np.ones((3, 2)))
+    with pytest.raises(np.linalg.LinAlgError):
+        B.cholesky_solve(np.stack([np.eye(3), a]), np.ones((2, 3, 2)))
+
+
+def test_logdet_from_chol(check_lazy_shapes):
+    check_function(B.logdet_from_chol, (PSDTriangular(),))
+    check_function(B.logdet_from_chol, (PSDTriangular(4, 3, 3),))
+
+    # Check correctness.
+    a = PSD(4, 3, 3).np()
+    approx(B.logdet_from_chol(np.linalg.cholesky(a)), np.linalg.slogdet(a)[1])
 
 
 @pytest.mark.parametrize("f", [B.triangular_solve, B.trisolve])
@@ -258,6 +352,44 @@ def test_triangular_solve(f, check_lazy_shapes):
         (PSDTriangular(5, 3, 3, upper=True), Matrix(5, 3, 4)),
         {"lower_a": Value(False)},
     )
+    # Check a matrix shared between batches.
+    check_function(f, (PSDTriangular(3, 3), Matrix(5, 3, 4)), {"lower_a": Value(True)})
+    # Check a batch of larger matrices, which are solved one by one.
+    check_function(
+        f, (PSDTriangular(5, 20, 20), Matrix(5, 20, 4)), {"lower_a": Value(True)}
+    )
+    check_function(
+        f,
+        (PSDTriangular(5, 20, 20, upper=True), Matrix(5, 20, 4)),
+        {"lower_a": Value(False)},
+    )
+
+
+@pytest.mark.parametrize("lower", [True, False])
+def test_triangular_solve_singular(lower, check_lazy_shapes):
+    a = PSDTriangular(2, 3, 3, upper=not lower).np()
+    a[1, 1, 1] = 0
+    # The batch of small matrices is solved in one call to `np.linalg.solve`, which
+    # must raise rather than return infinities or NaNs.
+    with pytest.raises(np.linalg.LinAlgError):
+        B.triangular_solve(a, np.ones((2, 3, 2)), lower_a=lower)
+
+
+@pytest.mark.parametrize("small", [0, 16])
+@pytest.mark.parametrize("lower", [True, False])
+def test_triangular_solve_layout(small, lower, monkeypatch, check_lazy_shapes):
+    monkeypatch.setattr(
+        sys.modules["lab.numpy.linear_algebra"], "_triangular_solve_small", small
+    )
+    b = Matrix(5, 3, 4).np()
+    # Check a batch of matrices which is neither C- nor Fortran-contiguous.
+    a = np.zeros((5, 3, 6))
+    a[..., ::2] = PSDTriangular(5, 3, 3, upper=not lower).np()
+    a = a[..., ::2]
+    approx(B.triangular_solve(a, b, lower_a=lower), np.linalg.solve(a, b))
+    # Check a Fortran-contiguous batch of matrices.
+    a = np.asfortranarray(a)
+    approx(B.triangular_solve(a, b, lower_a=lower), np.linalg.solve(a, b))
 
 
 @pytest.mark.parametrize("f", [B.toeplitz_solve, B.toepsolve])
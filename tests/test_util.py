@@ -8,14 +8,7 @@ import lab.autograd as B_autograd
 import lab.jax as B_jax
 import lab.tensorflow as B_tf
 import lab.torch as B_torch
-from lab.util import (
-    _common_shape,
-    _translate_index,
-    abstract,
-    as_tuple,
-    batch_computation,
-    resolve_axis,
-)
+from lab.util import _common_shape, abstract, as_tuple, batch_computation, resolve_axis
 
 # noinspections PyUnresolvedReferences
 from .util import approx, check_lazy_shapes
@@ -86,25 +79,6 @@ def test_common_shape_errors(shapes, check_lazy_shapes):
         _common_shape(*reversed(shapes))
 
 
-@pytest.mark.parametrize(
-    "index,batch_shape,translated_index",
-    [
-        ((5, 2), (3,), (2,)),
-        ((2, 3, 4), (5, 5), (3, 4)),
-        ((2, 3, 4), (1, 5), (0, 4)),
-        ((2, 3, 4), (5, 1), (3, 0)),
-    ],
-)
-def test_translate_index(index, batch_shape, translated_index, check_lazy_shapes):
-    assert _translate_index(index, batch_shape) == translated_index
-
-
-@pytest.mark.parametrize("index,batch_shape", [((5, 3), (3,)), ((2, 3, 4), (4, 4))])
-def test_translate_index_errors(index, batch_shape, check_lazy_shapes):
-    with pytest.raises(RuntimeError):
-        _translate_index(index, batch_shape)
-
-
 @pytest.mark.parametrize("x1_batch", [(), (1,), (2,), (2, 2), (2, 1), (1, 2)])
 @pytest.mark.parametrize("x2_batch", [(), (1,), (2,), (2, 2), (2, 1), (1, 2)])
 def test_batch_computation(x1_batch, x2_batch, check_lazy_shapes):